@@ -0,0 +1,78 @@
+"""并发吞吐基准：SDK 调用调度层
+
+模拟一个每次 l2_snapshot 需要 50ms 的慢速 Info，让 N 个客户端并发调用
+get_orderbook，观察吞吐量随客户端数量的变化。调用在有界线程池中执行，
+吞吐量应随客户端数近似线性增长，直到达到 max_workers 上限。
+
+运行: uv run python benchmarks/bench_concurrency.py
+"""
+
+import argparse
+import asyncio
+import time
+
+from common import build_service, print_table
+
+
+class SlowInfo:
+    """每次请求阻塞固定时长的 Info 桩"""
+
+    def __init__(self, latency: float):
+        self.latency = latency
+
+    def l2_snapshot(self, coin):
+        time.sleep(self.latency)
+        return {
+            "coin": coin,
+            "levels": [[{"px": "100", "sz": "1", "n": 1}]] * 2,
+            "time": 0,
+        }
+
+
+async def run_clients(service, clients: int, calls_per_client: int) -> float:
+    async def client():
+        for _ in range(calls_per_client):
+            result = await service.get_orderbook("BTC")
+            assert result["success"], result
+
+    started = time.perf_counter()
+    await asyncio.gather(*(client() for _ in range(clients)))
+    return time.perf_counter() - started
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--latency-ms", type=float, default=50.0)
+    parser.add_argument("--calls", type=int, default=10, help="calls per client")
+    parser.add_argument("--max-workers", type=int, default=16)
+    args = parser.parse_args()
+
+    service = build_service(
+        info=SlowInfo(args.latency_ms / 1000), max_workers=args.max_workers
+    )
+
+    rows = []
+    baseline = None
+    for clients in (1, 2, 4, 8, 16, 32):
+        elapsed = asyncio.run(run_clients(service, clients, args.calls))
+        throughput = clients * args.calls / elapsed
+        baseline = baseline or throughput
+        rows.append(
+            [
+                clients,
+                f"{elapsed:.2f}",
+                f"{throughput:.1f}",
+                f"{throughput / baseline:.1f}x",
+            ]
+        )
+
+    print(
+        f"upstream latency {args.latency_ms:.0f}ms, "
+        f"max_workers={args.max_workers}, {args.calls} calls/client\n"
+    )
+    print_table(["clients", "seconds", "req/s", "scaling"], rows)
+    service.executor.shutdown()
+
+
+if __name__ == "__main__":
+    main()
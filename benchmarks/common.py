@@ -0,0 +1,65 @@
+"""基准测试公共工具
+
+基准测试不访问真实 HyperLiquid API：Info / Exchange 由本地桩对象替代，
+通过可配置的延迟模拟上游网络往返。
+"""
+
+import statistics
+import sys
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+# 允许直接以脚本方式运行: python benchmarks/bench_xxx.py
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from services.hyperliquid_services import HyperliquidServices  # noqa: E402
+
+
+def build_service(
+    info: Any = None, exchange: Any = None, **service_kwargs: Any
+) -> HyperliquidServices:
+    """创建使用桩 Info/Exchange 的服务实例"""
+    with (
+        patch("services.hyperliquid_services.Info") as mock_info_class,
+        patch("services.hyperliquid_services.Exchange") as mock_exchange_class,
+        patch("eth_account.Account") as mock_account_class,
+    ):
+        mock_account_class.from_key.return_value = MagicMock(address="0xBENCH")
+        mock_info_class.return_value = info if info is not None else MagicMock()
+        mock_exchange_class.return_value = (
+            exchange if exchange is not None else MagicMock()
+        )
+        service = HyperliquidServices(
+            private_key="0x" + "1" * 64,
+            testnet=True,
+            account_address="0xBENCH",
+            **service_kwargs,
+        )
+    service.logger.setLevel("WARNING")
+    return service
+
+
+def time_call(func: Callable[[], Any], repeat: int = 5) -> float:
+    """返回多次执行的中位耗时（秒）"""
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        samples.append(time.perf_counter() - started)
+    return statistics.median(samples)
+
+
+def print_table(headers: list[str], rows: list[list[Any]]) -> None:
+    """以固定宽度表格打印结果"""
+    widths = [
+        max(len(str(headers[i])), *(len(str(row[i])) for row in rows))
+        for i in range(len(headers))
+    ]
+    line = "  ".join(str(h).rjust(w) for h, w in zip(headers, widths, strict=True))
+    print(line)
+    print("-" * len(line))
+    for row in rows:
+        print("  ".join(str(c).rjust(w) for c, w in zip(row, widths, strict=True)))
@@ -9,6 +9,14 @@ from fastmcp import FastMCP
 from pydantic import BaseModel, Field, model_validator
 from pydantic import ValidationError as PydanticValidationError
 
+from services.constants import (
+    DEFAULT_CALL_TIMEOUT,
+    DEFAULT_CANDLE_CONCURRENCY,
+    DEFAULT_CANDLE_TIMEOUT,
+    DEFAULT_HTTP_POOL_SIZE,
+    DEFAULT_MAX_WORKERS,
+    DEFAULT_METADATA_REFRESH_INTERVAL,
+)
 from services.hyperliquid_services import HyperliquidServices
 from services.validators import ValidationError, validate_coin, validate_order_inputs
 
@@ -42,6 +50,65 @@ class ConfigModel(BaseModel):
         default=None,
         description="Account address (derived from private key if not provided)",
     )
+    max_workers: int = Field(
+        default=DEFAULT_MAX_WORKERS,
+        gt=0,
+        description="Maximum number of concurrent blocking SDK calls",
+    )
+    call_timeout: float | None = Field(
+        default=DEFAULT_CALL_TIMEOUT,
+        gt=0,
+        description="Timeout in seconds for each upstream SDK call",
+    )
+    async_transport: bool = Field(
+        default=False,
+        description="Use the pooled asyncio HTTP transport for /info and /exchange",
+    )
+    http_pool_size: int = Field(
+        default=DEFAULT_HTTP_POOL_SIZE,
+        gt=0,
+        description="Maximum pooled connections for the async transport",
+    )
+    http2: bool = Field(
+        default=False, description="Negotiate HTTP/2 on the async transport"
+    )
+    candle_concurrency: int = Field(
+        default=DEFAULT_CANDLE_CONCURRENCY,
+        gt=0,
+        description="Maximum in-flight candle requests per bulk call",
+    )
+    candle_timeout: float | None = Field(
+        default=DEFAULT_CANDLE_TIMEOUT,
+        gt=0,
+        description="Timeout in seconds for each coin's candle request",
+    )
+    metadata_refresh_interval: float | None = Field(
+        default=DEFAULT_METADATA_REFRESH_INTERVAL,
+        gt=0,
+        description="Seconds between background refreshes of asset metadata",
+    )
+
+
+# Optional tuning settings that can be overridden via environment variables
+TUNING_ENV_VARS = {
+    "max_workers": "HYPERLIQUID_MAX_WORKERS",
+    "call_timeout": "HYPERLIQUID_CALL_TIMEOUT",
+    "async_transport": "HYPERLIQUID_ASYNC_TRANSPORT",
+    "http_pool_size": "HYPERLIQUID_HTTP_POOL_SIZE",
+    "http2": "HYPERLIQUID_HTTP2",
+    "candle_concurrency": "HYPERLIQUID_CANDLE_CONCURRENCY",
+    "candle_timeout": "HYPERLIQUID_CANDLE_TIMEOUT",
+    "metadata_refresh_interval": "HYPERLIQUID_METADATA_REFRESH_INTERVAL",
+}
+
+
+def _tuning_overrides() -> dict[str, str]:
+    """Collect tuning settings present in the environment"""
+    return {
+        field: os.environ[env_var]
+        for field, env_var in TUNING_ENV_VARS.items()
+        if os.getenv(env_var)
+    }
 
 
 def get_config() -> ConfigModel:
@@ -53,7 +120,10 @@ def get_config() -> ConfigModel:
 
     if private_key:
         return ConfigModel(
-            private_key=private_key, testnet=testnet, account_address=account_address
+            private_key=private_key,
+            testnet=testnet,
+            account_address=account_address,
+            **_tuning_overrides(),
         )
 
     # Try config file
@@ -61,7 +131,7 @@ def get_config() -> ConfigModel:
     if os.path.exists(config_path):
         with open(config_path) as f:
             config_data = json.load(f)
-            return ConfigModel(**config_data)
+            return ConfigModel(**{**config_data, **_tuning_overrides()})
 
     raise ValueError(
         "No configuration found. Please set HYPERLIQUID_PRIVATE_KEY environment variable "
@@ -80,6 +150,14 @@ def initialize_service():
             private_key=config.private_key,
             testnet=config.testnet,
             account_address=config.account_address,
+            max_workers=config.max_workers,
+            call_timeout=config.call_timeout,
+            async_transport=config.async_transport,
+            http_pool_size=config.http_pool_size,
+            http2=config.http2,
+            candle_concurrency=config.candle_concurrency,
+            candle_timeout=config.candle_timeout,
+            metadata_refresh_interval=config.metadata_refresh_interval,
         )
         account_info = config.account_address or "Derived from private key"
         logger.info(f"Service initialized for account: {account_info}")
@@ -657,28 +735,7 @@ async def set_stop_loss(
 async def get_account_summary() -> dict[str, Any]:
     """Get a comprehensive account summary including balance, positions, and orders"""
     initialize_service()
-
-    # Get all account information
-    balance = await hyperliquid_service.get_account_balance()
-    positions = await hyperliquid_service.get_open_positions()
-    orders = await hyperliquid_service.get_open_orders()
-
-    return {
-        "success": True,
-        "summary": {
-            "balance": balance.get("data") if balance.get("success") else None,
-            "positions": (
-                positions.get("positions", []) if positions.get("success") else []
-            ),
-            "orders": orders.get("orders", []) if orders.get("success") else [],
-            "total_positions": (
-                positions.get("total_positions", 0) if positions.get("success") else 0
-            ),
-            "total_orders": (
-                orders.get("total_orders", 0) if orders.get("success") else 0
-            ),
-        },
-    }
+    return await hyperliquid_service.get_account_summary()
 
 
 @mcp.tool
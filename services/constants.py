@@ -17,3 +17,19 @@ AGGRESSIVE_SLIPPAGE = 0.5  # 50%
 # 地址掩码配置
 ADDRESS_PREFIX_LEN = 6
 ADDRESS_SUFFIX_LEN = 4
+
+# SDK 调用调度配置
+DEFAULT_MAX_WORKERS = 16  # 同时执行的 SDK 调用上限
+DEFAULT_CALL_TIMEOUT = 15.0  # 单次 SDK 调用超时（秒）
+
+# 异步 HTTP 传输配置
+DEFAULT_HTTP_POOL_SIZE = 20  # 连接池最大连接数
+DEFAULT_HTTP_KEEPALIVE_EXPIRY = 30.0  # 空闲连接保活时间（秒）
+
+# K 线批量请求配置
+DEFAULT_CANDLE_CONCURRENCY = 8  # 单次批量请求中同时在途的币种数
+DEFAULT_CANDLE_TIMEOUT = 10.0  # 单个币种请求超时（秒）
+
+# 资产元数据缓存配置
+DEFAULT_METADATA_REFRESH_INTERVAL = 300.0  # 元数据后台刷新间隔（秒）
+SPOT_ASSET_OFFSET = 10_000  # 现货资产编号偏移
@@ -0,0 +1,80 @@
+import asyncio
+import functools
+import inspect
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+from .constants import DEFAULT_CALL_TIMEOUT, DEFAULT_MAX_WORKERS
+
+
+class SDKCallTimeoutError(TimeoutError):
+    """Raised when an upstream SDK call does not finish within its timeout"""
+
+
+class SDKExecutor:
+    """
+    Bounded dispatch layer for blocking HyperLiquid SDK calls
+
+    The SDK performs synchronous HTTP requests, so calling it directly from an
+    ``async def`` stalls the event loop for every other client. Calls are run on
+    a dedicated thread pool instead; the pool size bounds upstream concurrency
+    and every call is subject to a timeout. A call that times out (or whose
+    awaiting task is cancelled) while still queued never starts.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        call_timeout: float | None = DEFAULT_CALL_TIMEOUT,
+    ):
+        """
+        Args:
+            max_workers: Maximum number of SDK calls running at the same time
+            call_timeout: Default per-call timeout in seconds (None disables it)
+        """
+        if max_workers <= 0:
+            raise ValueError("max_workers must be a positive integer")
+        if call_timeout is not None and call_timeout <= 0:
+            raise ValueError("call_timeout must be positive or None")
+
+        self.max_workers = max_workers
+        self.call_timeout = call_timeout
+        self._pool = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="hyperliquid-sdk"
+        )
+
+    async def run(
+        self,
+        func: Callable[..., Any],
+        *args: Any,
+        timeout: float | None = None,
+        **kwargs: Any,
+    ) -> Any:
+        """
+        Run ``func(*args, **kwargs)`` without blocking the event loop
+
+        Coroutine functions are awaited directly; plain callables are executed
+        on the thread pool. ``timeout`` overrides the default call timeout.
+        """
+        effective_timeout = self.call_timeout if timeout is None else timeout
+        name = getattr(func, "__name__", repr(func))
+
+        if inspect.iscoroutinefunction(func):
+            awaitable = func(*args, **kwargs)
+        else:
+            loop = asyncio.get_running_loop()
+            awaitable = loop.run_in_executor(
+                self._pool, functools.partial(func, *args, **kwargs)
+            )
+
+        try:
+            return await asyncio.wait_for(awaitable, effective_timeout)
+        except asyncio.TimeoutError as e:
+            raise SDKCallTimeoutError(
+                f"{name} timed out after {effective_timeout}s"
+            ) from e
+
+    def shutdown(self, wait: bool = False) -> None:
+        """Stop accepting work and drop calls that have not started yet"""
+        self._pool.shutdown(wait=wait, cancel_futures=True)
@@ -1,3 +1,4 @@
+import asyncio
 import logging
 import time
 from typing import Any
@@ -13,16 +14,36 @@ from hyperliquid.utils.signing import (
 from hyperliquid.utils.types import Cloid
 
 from .constants import (
+    DEFAULT_CALL_TIMEOUT,
+    DEFAULT_CANDLE_CONCURRENCY,
+    DEFAULT_CANDLE_TIMEOUT,
+    DEFAULT_HTTP_POOL_SIZE,
+    DEFAULT_MAX_WORKERS,
+    DEFAULT_METADATA_REFRESH_INTERVAL,
     OCO_GROUP_EXISTING_POSITION,
     OCO_GROUP_NEW_POSITION,
 )
+from .executor import SDKExecutor
+from .metadata import AssetInfo, MetadataCache
+from .transport import AsyncHyperliquidTransport, AsyncInfo
 
 
 class HyperliquidServices:
     """Comprehensive HyperLiquid services for trading and account management"""
 
     def __init__(
-        self, private_key: str, testnet: bool = False, account_address: str = None
+        self,
+        private_key: str,
+        testnet: bool = False,
+        account_address: str = None,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        call_timeout: float | None = DEFAULT_CALL_TIMEOUT,
+        async_transport: bool = False,
+        http_pool_size: int = DEFAULT_HTTP_POOL_SIZE,
+        http2: bool = False,
+        candle_concurrency: int = DEFAULT_CANDLE_CONCURRENCY,
+        candle_timeout: float | None = DEFAULT_CANDLE_TIMEOUT,
+        metadata_refresh_interval: float | None = DEFAULT_METADATA_REFRESH_INTERVAL,
     ):
         """
         Initialize HyperLiquid services
@@ -31,6 +52,16 @@ class HyperliquidServices:
             private_key: Private key for signing transactions
             testnet: Whether to use testnet (default: False for mainnet)
             account_address: Optional account address (will be derived from private key if not provided)
+            max_workers: Maximum number of concurrent blocking SDK calls
+            call_timeout: Default timeout in seconds for each SDK call
+            async_transport: Issue /info and /exchange requests on the event loop
+                over a pooled keep-alive HTTP client instead of the blocking SDK
+            http_pool_size: Maximum pooled connections for the async transport
+            http2: Negotiate HTTP/2 on the async transport
+            candle_concurrency: Maximum in-flight candle requests per bulk call
+            candle_timeout: Timeout in seconds for each coin's candle request
+            metadata_refresh_interval: Seconds between background refreshes of
+                the cached asset metadata
         """
         self.private_key = private_key
         self.testnet = testnet
@@ -70,12 +101,118 @@ class HyperliquidServices:
         self.info = Info(self.base_url, skip_ws=True)
         self.exchange = Exchange(self.wallet, self.base_url)
 
+        # Blocking SDK calls are dispatched to a bounded thread pool
+        self.executor = SDKExecutor(max_workers=max_workers, call_timeout=call_timeout)
+
+        # Optional native asyncio transport; the SDK clients are still used for
+        # asset metadata and for actions the service does not build itself
+        self.transport: AsyncHyperliquidTransport | None = None
+        self.async_info: AsyncInfo | None = None
+        if async_transport:
+            self.transport = AsyncHyperliquidTransport(
+                self.base_url,
+                pool_size=http_pool_size,
+                http2=http2,
+                timeout=call_timeout,
+            )
+            self.async_info = AsyncInfo(
+                self.transport,
+                coin_resolver=self._resolve_coin,
+            )
+        self._last_nonce = 0
+
+        # Asset metadata (universe and spot meta) indexed by coin name
+        self.metadata = MetadataCache(
+            lambda: self._info("meta"),
+            lambda: self._info("spot_meta"),
+            refresh_interval=metadata_refresh_interval,
+            logger=self.logger,
+        )
+
+        if candle_concurrency <= 0:
+            raise ValueError("candle_concurrency must be a positive integer")
+        self.candle_concurrency = candle_concurrency
+        self.candle_timeout = candle_timeout
+
         network = "testnet" if testnet else "mainnet"
         self.logger.info(
             f"HyperliquidServices initialized for account {self.account_address} on {network}"
         )
 
-    def _bulk_orders_with_grouping(self, order_requests, grouping="na", builder=None):
+    async def _call(self, func, *args, timeout: float | None = None, **kwargs) -> Any:
+        """Run a blocking SDK callable on the executor with a timeout"""
+        return await self.executor.run(func, *args, timeout=timeout, **kwargs)
+
+    async def _info(self, method: str, *args, timeout: float | None = None) -> Any:
+        """Dispatch an Info endpoint call, e.g. ``await self._info("all_mids")``"""
+        client = self.info
+        if self.async_info is not None and hasattr(self.async_info, method):
+            client = self.async_info
+        return await self._call(getattr(client, method), *args, timeout=timeout)
+
+    async def _exchange(self, method: str, *args, timeout: float | None = None) -> Any:
+        """Dispatch an Exchange action, e.g. ``await self._exchange("cancel", ...)``"""
+        return await self._call(getattr(self.exchange, method), *args, timeout=timeout)
+
+    async def _asset_info(self, coin: str) -> AssetInfo | None:
+        """Cached metadata for ``coin``; None if the coin is unknown or unavailable"""
+        try:
+            return await self.metadata.get(coin)
+        except Exception as e:
+            self.logger.warning(f"Asset metadata unavailable: {e}")
+            return None
+
+    async def _asset_index(self, coin: str) -> int:
+        """Asset index used in actions, falling back to the SDK's startup mapping"""
+        asset_info = await self._asset_info(coin)
+        if asset_info is not None:
+            return asset_info.asset
+        return self.info.name_to_asset(coin)
+
+    def _resolve_coin(self, name: str) -> str:
+        """Map a user-facing name (e.g. "PURR/USDC") to the API coin"""
+        asset_info = self.metadata.lookup(name)
+        if asset_info is not None:
+            return asset_info.coin
+        return self.info.name_to_coin.get(name, name)
+
+    def _next_nonce(self) -> int:
+        """Millisecond timestamp nonce, strictly increasing across actions"""
+        self._last_nonce = max(int(time.time() * 1000), self._last_nonce + 1)
+        return self._last_nonce
+
+    async def _post_action(self, action: dict[str, Any], signature, nonce: int) -> Any:
+        """POST a signed action to /exchange"""
+        if self.transport is None:
+            return await self._call(
+                self.exchange._post_action, action, signature, nonce
+            )
+        payload = {
+            "action": action,
+            "nonce": nonce,
+            "signature": signature,
+            "vaultAddress": self.exchange.vault_address,
+            "expiresAfter": self.exchange.expires_after,
+        }
+        return await self._call(self.transport.post, "/exchange", payload)
+
+    async def _sign_and_post(self, action: dict[str, Any]) -> Any:
+        """Sign an L1 action with the wallet and submit it"""
+        nonce = self._next_nonce()
+        signature = await self._call(
+            sign_l1_action,
+            self.exchange.wallet,
+            action,
+            self.exchange.vault_address,
+            nonce,
+            self.exchange.expires_after,
+            self.is_mainnet,
+        )
+        return await self._post_action(action, signature, nonce)
+
+    async def _bulk_orders_with_grouping(
+        self, order_requests, grouping="na", builder=None
+    ):
         """
         Custom bulk orders implementation that allows setting proper grouping for OCO orders
         """
@@ -89,7 +226,7 @@ class HyperliquidServices:
         for i, order in enumerate(order_requests):
             try:
                 wire = order_request_to_order_wire(
-                    order, self.info.name_to_asset(order["coin"])
+                    order, await self._asset_index(order["coin"])
                 )
                 self.logger.info(f"Order wire {i}: {wire}")
                 order_wires.append(wire)
@@ -98,9 +235,6 @@ class HyperliquidServices:
                 self.logger.error(f"Problem order: {order}")
                 raise
 
-        # Get timestamp
-        timestamp = int(time.time() * 1000)
-
         # Create the order action using the SDK's function
         order_action = order_wires_to_order_action(order_wires, None)
 
@@ -114,25 +248,13 @@ class HyperliquidServices:
 
         self.logger.info(f"Order action as JSON: {json.dumps(order_action, indent=2)}")
 
-        expires_after = self.exchange.expires_after
-
-        # Sign the action using the same approach as the working code
-        signature = sign_l1_action(
-            self.exchange.wallet,
-            order_action,
-            self.exchange.vault_address,
-            timestamp,
-            expires_after,
-            self.is_mainnet,
-        )
-
-        # Post the action
-        return self.exchange._post_action(order_action, signature, timestamp)
+        # Sign and post the action
+        return await self._sign_and_post(order_action)
 
     async def get_account_balance(self) -> dict[str, Any]:
         """Get account balance and margin information"""
         try:
-            user_state = self.info.user_state(self.account_address)
+            user_state = await self._info("user_state", self.account_address)
             return {
                 "success": True,
                 "data": user_state,
@@ -142,25 +264,49 @@ class HyperliquidServices:
             self.logger.error(f"Failed to get account balance: {str(e)}", exc_info=True)
             return {"success": False, "error": str(e)}
 
+    @staticmethod
+    def _format_positions(user_state: dict[str, Any]) -> list[dict[str, Any]]:
+        """Extract non-zero positions from a clearinghouse state"""
+        formatted_positions = []
+        for pos in user_state.get("assetPositions", []):
+            if pos["position"]["szi"] != "0":  # Only include non-zero positions
+                formatted_positions.append(
+                    {
+                        "coin": pos["position"]["coin"],
+                        "size": pos["position"]["szi"],
+                        "entry_price": pos["position"]["entryPx"],
+                        "unrealized_pnl": pos["position"]["unrealizedPnl"],
+                        "return_on_equity": pos["position"]["returnOnEquity"],
+                        "margin_used": pos["position"]["marginUsed"],
+                    }
+                )
+        return formatted_positions
+
+    @staticmethod
+    def _format_orders(open_orders: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Normalize raw open orders"""
+        formatted_orders = []
+        for order in open_orders:
+            formatted_orders.append(
+                {
+                    "order_id": order["oid"],
+                    "coin": order["coin"],
+                    "side": "buy" if order["side"] == "B" else "sell",
+                    "size": order["sz"],
+                    "limit_price": order["limitPx"],
+                    "reduce_only": order.get("reduceOnly", False),
+                    "order_type": order.get("orderType", "unknown"),
+                    "timestamp": order["timestamp"],
+                    "cloid": order.get("cloid"),
+                }
+            )
+        return formatted_orders
+
     async def get_open_positions(self) -> dict[str, Any]:
         """Get all open positions"""
         try:
-            user_state = self.info.user_state(self.account_address)
-            positions = user_state.get("assetPositions", [])
-
-            formatted_positions = []
-            for pos in positions:
-                if pos["position"]["szi"] != "0":  # Only include non-zero positions
-                    formatted_positions.append(
-                        {
-                            "coin": pos["position"]["coin"],
-                            "size": pos["position"]["szi"],
-                            "entry_price": pos["position"]["entryPx"],
-                            "unrealized_pnl": pos["position"]["unrealizedPnl"],
-                            "return_on_equity": pos["position"]["returnOnEquity"],
-                            "margin_used": pos["position"]["marginUsed"],
-                        }
-                    )
+            user_state = await self._info("user_state", self.account_address)
+            formatted_positions = self._format_positions(user_state)
 
             return {
                 "success": True,
@@ -174,23 +320,8 @@ class HyperliquidServices:
     async def get_open_orders(self) -> dict[str, Any]:
         """Get all open orders"""
         try:
-            open_orders = self.info.open_orders(self.account_address)
-
-            formatted_orders = []
-            for order in open_orders:
-                formatted_orders.append(
-                    {
-                        "order_id": order["oid"],
-                        "coin": order["coin"],
-                        "side": "buy" if order["side"] == "B" else "sell",
-                        "size": order["sz"],
-                        "limit_price": order["limitPx"],
-                        "reduce_only": order.get("reduceOnly", False),
-                        "order_type": order.get("orderType", "unknown"),
-                        "timestamp": order["timestamp"],
-                        "cloid": order.get("cloid"),
-                    }
-                )
+            open_orders = await self._info("open_orders", self.account_address)
+            formatted_orders = self._format_orders(open_orders)
 
             return {
                 "success": True,
@@ -201,6 +332,49 @@ class HyperliquidServices:
             self.logger.error(f"Failed to get open orders: {str(e)}", exc_info=True)
             return {"success": False, "error": str(e)}
 
+    async def get_account_summary(self) -> dict[str, Any]:
+        """
+        Get balance, positions and open orders from a single account snapshot
+
+        One clearinghouse state and one open orders request are issued
+        concurrently; balance and positions are both derived from the same
+        clearinghouse state so the summary is internally consistent.
+        """
+        user_state, open_orders = await asyncio.gather(
+            self._info("user_state", self.account_address),
+            self._info("open_orders", self.account_address),
+            return_exceptions=True,
+        )
+
+        summary: dict[str, Any] = {
+            "balance": None,
+            "positions": [],
+            "orders": [],
+            "total_positions": 0,
+            "total_orders": 0,
+        }
+        errors: dict[str, str] = {}
+
+        if isinstance(user_state, BaseException):
+            errors["balance"] = str(user_state)
+            self.logger.error("Failed to get account state: %s", user_state)
+        else:
+            summary["balance"] = user_state
+            summary["positions"] = self._format_positions(user_state)
+            summary["total_positions"] = len(summary["positions"])
+
+        if isinstance(open_orders, BaseException):
+            errors["orders"] = str(open_orders)
+            self.logger.error("Failed to get open orders: %s", open_orders)
+        else:
+            summary["orders"] = self._format_orders(open_orders)
+            summary["total_orders"] = len(summary["orders"])
+
+        response: dict[str, Any] = {"success": True, "summary": summary}
+        if errors:
+            response["errors"] = errors
+        return response
+
     async def place_order(
         self,
         coin: str,
@@ -245,20 +419,20 @@ class HyperliquidServices:
             if order_type is None:
                 order_type = {"limit": {"tif": "Gtc"}}
 
+            order_request = {
+                "coin": coin,
+                "is_buy": is_buy,
+                "sz": float(sz),
+                "limit_px": float(limit_px),
+                "order_type": order_type,
+                "reduce_only": reduce_only,
+            }
             if cloid is not None:
-                order_result = self.exchange.order(
-                    coin,
-                    is_buy,
-                    float(sz),
-                    float(limit_px),
-                    order_type,
-                    reduce_only,
-                    cloid,
-                )
-            else:
-                order_result = self.exchange.order(
-                    coin, is_buy, float(sz), float(limit_px), order_type, reduce_only
-                )
+                order_request["cloid"] = Cloid(cloid)
+
+            order_result = await self._call(
+                self._bulk_orders_with_grouping, [order_request], grouping="na"
+            )
 
             self.logger.info(f"Order placed successfully: {order_result}")
 
@@ -365,8 +539,10 @@ class HyperliquidServices:
 
             # Use custom bulk_orders with normalTpsl grouping for proper OCO behavior
             # Note: Standard SDK bulk_orders doesn't set grouping parameter correctly for OCO
-            bulk_result = self._bulk_orders_with_grouping(
-                order_requests, grouping=OCO_GROUP_NEW_POSITION
+            bulk_result = await self._call(
+                self._bulk_orders_with_grouping,
+                order_requests,
+                grouping=OCO_GROUP_NEW_POSITION,
             )
 
             self.logger.info(
@@ -395,7 +571,12 @@ class HyperliquidServices:
         """Cancel a specific order by order ID"""
         try:
             self.logger.info(f"Cancelling order {oid} for {coin}")
-            cancel_result = self.exchange.cancel(coin, oid)
+            cancel_result = await self._sign_and_post(
+                {
+                    "type": "cancel",
+                    "cancels": [{"a": await self._asset_index(coin), "o": oid}],
+                }
+            )
             self.logger.info("Order %s cancelled successfully: %s", oid, cancel_result)
             return {
                 "success": True,
@@ -418,7 +599,14 @@ class HyperliquidServices:
         """
         try:
             self.logger.info(f"Cancelling order {cloid} for {coin}")
-            cancel_result = self.exchange.cancel_by_cloid(coin, cloid)
+            cancel_result = await self._sign_and_post(
+                {
+                    "type": "cancelByCloid",
+                    "cancels": [
+                        {"asset": await self._asset_index(coin), "cloid": cloid}
+                    ],
+                }
+            )
             self.logger.info(
                 "Order %s cancelled successfully: %s", cloid, cancel_result
             )
@@ -439,7 +627,7 @@ class HyperliquidServices:
             if coin:
                 self.logger.info(f"Cancelling all orders for {coin}")
                 # Cancel all orders for specific coin
-                open_orders = self.info.open_orders(self.account_address)
+                open_orders = await self._info("open_orders", self.account_address)
                 coin_orders = [order for order in open_orders if order["coin"] == coin]
 
                 results = []
@@ -463,7 +651,7 @@ class HyperliquidServices:
             else:
                 self.logger.info("Cancelling all orders")
                 # Get all open orders and cancel them individually
-                open_orders = self.info.open_orders(self.account_address)
+                open_orders = await self._info("open_orders", self.account_address)
 
                 results = []
                 for order in open_orders:
@@ -500,7 +688,8 @@ class HyperliquidServices:
             self.logger.info(
                 f"Modifying order {oid} for {coin}: new size={new_sz}, new price={new_limit_px}"
             )
-            modify_result = self.exchange.modify_order(
+            modify_result = await self._exchange(
+                "modify_order",
                 coin,
                 oid,
                 {
@@ -534,11 +723,11 @@ class HyperliquidServices:
     async def get_market_data(self, coin: str) -> dict[str, Any]:
         """Get market data for a specific coin including bid/ask prices"""
         try:
-            all_mids = self.info.all_mids()
-            meta = self.info.meta()
+            all_mids = await self._info("all_mids")
+            asset_info = await self._asset_info(coin)
 
             # Get orderbook for bid/ask prices
-            l2_book = self.info.l2_snapshot(coin)
+            l2_book = await self._info("l2_snapshot", coin)
 
             market_data = {
                 "coin": coin,
@@ -562,13 +751,11 @@ class HyperliquidServices:
                 market_data["ask_size"] = "N/A"
 
             # Add universe data if available
-            universe = meta.get("universe", [])
-            coin_info = next((item for item in universe if item["name"] == coin), None)
-            if coin_info:
+            if asset_info is not None and not asset_info.is_spot:
                 market_data.update(
                     {
-                        "max_leverage": coin_info.get("maxLeverage", "N/A"),
-                        "only_isolated": coin_info.get("onlyIsolated", False),
+                        "max_leverage": asset_info.max_leverage or "N/A",
+                        "only_isolated": asset_info.only_isolated,
                     }
                 )
 
@@ -582,7 +769,7 @@ class HyperliquidServices:
     async def get_orderbook(self, coin: str, depth: int = 20) -> dict[str, Any]:
         """Get orderbook data for a specific coin"""
         try:
-            l2_book = self.info.l2_snapshot(coin)
+            l2_book = await self._info("l2_snapshot", coin)
 
             # Limit depth
             bids = l2_book["levels"][0][:depth] if len(l2_book["levels"]) > 0 else []
@@ -603,6 +790,39 @@ class HyperliquidServices:
             )
             return {"success": False, "error": str(e)}
 
+    def _format_candles(
+        self, coin: str, raw_candles: list[dict[str, Any]] | None
+    ) -> list[dict[str, Any]]:
+        """Convert raw candleSnapshot entries into sorted OHLCV dicts"""
+        formatted_candles: list[dict[str, Any]] = []
+        for candle in raw_candles or []:
+            timestamp = candle.get("t") or candle.get("T")
+            if timestamp is None:
+                # Skip malformed entries without timestamp
+                continue
+
+            try:
+                formatted_candles.append(
+                    {
+                        "timestamp": int(timestamp),
+                        "open": float(candle["o"]),
+                        "high": float(candle["h"]),
+                        "low": float(candle["l"]),
+                        "close": float(candle["c"]),
+                        "volume": float(candle["v"]),
+                        "trade_count": int(candle.get("n", 0)),
+                    }
+                )
+            except (KeyError, TypeError, ValueError) as format_error:
+                self.logger.warning(
+                    "Skipping malformed candle for %s: %s",
+                    coin,
+                    format_error,
+                )
+
+        formatted_candles.sort(key=lambda item: item["timestamp"])
+        return formatted_candles
+
     async def get_candles_snapshot_bulk(
         self,
         coins: list[str],
@@ -665,51 +885,37 @@ class HyperliquidServices:
             if effective_start >= effective_end:
                 raise ValueError("start_time must be less than end_time")
 
-            candles_by_coin: dict[str, list[dict[str, Any]]] = {}
-            coin_errors: dict[str, str] = {}
+            semaphore = asyncio.Semaphore(self.candle_concurrency)
 
-            for coin in normalized_coins:
-                try:
-                    raw_candles = self.info.candles_snapshot(
+            async def fetch_coin(coin: str) -> list[dict[str, Any]]:
+                async with semaphore:
+                    raw_candles = await self._info(
+                        "candles_snapshot",
                         coin,
                         interval,
                         effective_start,
                         effective_end,
+                        timeout=self.candle_timeout,
                     )
+                return self._format_candles(coin, raw_candles)
 
-                    formatted_candles: list[dict[str, Any]] = []
-                    for candle in raw_candles or []:
-                        timestamp = candle.get("t") or candle.get("T")
-                        if timestamp is None:
-                            # Skip malformed entries without timestamp
-                            continue
-
-                        try:
-                            formatted_candles.append(
-                                {
-                                    "timestamp": int(timestamp),
-                                    "open": float(candle["o"]),
-                                    "high": float(candle["h"]),
-                                    "low": float(candle["l"]),
-                                    "close": float(candle["c"]),
-                                    "volume": float(candle["v"]),
-                                    "trade_count": int(candle.get("n", 0)),
-                                }
-                            )
-                        except (KeyError, TypeError, ValueError) as format_error:
-                            self.logger.warning(
-                                "Skipping malformed candle for %s: %s",
-                                coin,
-                                format_error,
-                            )
-
-                    formatted_candles.sort(key=lambda item: item["timestamp"])
-                    candles_by_coin[coin] = formatted_candles
-                except Exception as coin_error:
-                    coin_errors[coin] = str(coin_error)
+            # Fan out with bounded concurrency; results keep the request order
+            results = await asyncio.gather(
+                *(fetch_coin(coin) for coin in normalized_coins),
+                return_exceptions=True,
+            )
+
+            candles_by_coin: dict[str, list[dict[str, Any]]] = {}
+            coin_errors: dict[str, str] = {}
+
+            for coin, result in zip(normalized_coins, results, strict=True):
+                if isinstance(result, BaseException):
+                    coin_errors[coin] = str(result)
                     self.logger.error(
-                        "Failed to fetch candles for %s: %s", coin, coin_error
+                        "Failed to fetch candles for %s: %s", coin, result
                     )
+                else:
+                    candles_by_coin[coin] = result
 
             if not candles_by_coin:
                 return {
@@ -755,8 +961,13 @@ class HyperliquidServices:
 
             # Try the standard parameter order first
             try:
-                leverage_result = self.exchange.update_leverage(
-                    leverage, coin, is_cross
+                leverage_result = await self._sign_and_post(
+                    {
+                        "type": "updateLeverage",
+                        "asset": await self._asset_index(coin),
+                        "isCross": is_cross,
+                        "leverage": leverage,
+                    }
                 )
             except Exception as e:
                 # If that fails, this might be a version issue - try alternative approaches
@@ -793,7 +1004,9 @@ class HyperliquidServices:
             direction = "spot to perp" if to_perp else "perp to spot"
             self.logger.info(f"Transferring {amount} from {direction}")
 
-            transfer_result = self.exchange.usd_class_transfer(float(amount), to_perp)
+            transfer_result = await self._exchange(
+                "usd_class_transfer", float(amount), to_perp
+            )
 
             self.logger.info(f"Transfer completed successfully: {transfer_result}")
 
@@ -815,7 +1028,9 @@ class HyperliquidServices:
             end_time = int(time.time() * 1000)
             start_time = end_time - (days * 24 * 60 * 60 * 1000)
 
-            funding_history = self.info.funding_history(coin, start_time, end_time)
+            funding_history = await self._info(
+                "funding_history", coin, start_time, end_time
+            )
 
             return {
                 "success": True,
@@ -832,7 +1047,7 @@ class HyperliquidServices:
     async def get_trade_history(self, days: int = 7) -> dict[str, Any]:
         """Get trade history for the account"""
         try:
-            user_fills = self.info.user_fills(self.account_address)
+            user_fills = await self._info("user_fills", self.account_address)
 
             # Filter by days if needed
             if days > 0:
@@ -888,7 +1103,7 @@ class HyperliquidServices:
 
             # Get current position if size not provided
             if position_size is None:
-                user_state = self.info.user_state(self.account_address)
+                user_state = await self._info("user_state", self.account_address)
 
                 position_found = False
                 for position in user_state.get("assetPositions", []):
@@ -905,7 +1120,7 @@ class HyperliquidServices:
             position_size = float(position_size)
 
             # Determine if position is long or short
-            user_state = self.info.user_state(self.account_address)
+            user_state = await self._info("user_state", self.account_address)
             is_long = True  # Default
             for position in user_state.get("assetPositions", []):
                 if position.get("position", {}).get("coin") == coin:
@@ -962,8 +1177,10 @@ class HyperliquidServices:
             # Try using the SDK's bulk_orders method with positionTpSl grouping
             try:
                 # 直接使用自定义方法确保分组正确
-                bulk_result = self._bulk_orders_with_grouping(
-                    order_requests, grouping=OCO_GROUP_EXISTING_POSITION
+                bulk_result = await self._call(
+                    self._bulk_orders_with_grouping,
+                    order_requests,
+                    grouping=OCO_GROUP_EXISTING_POSITION,
                 )
                 self.logger.info(f"Position TP/SL set successfully: {bulk_result}")
             except Exception as e:
@@ -1021,7 +1238,9 @@ class HyperliquidServices:
             )
 
             # Use market_open directly
-            order_result = self.exchange.market_open(coin, is_buy, float(sz), cloid)
+            order_result = await self._exchange(
+                "market_open", coin, is_buy, float(sz), cloid
+            )
 
             self.logger.info(f"Position opened successfully for {coin}: {order_result}")
 
@@ -1065,7 +1284,7 @@ class HyperliquidServices:
         """
         try:
             # Get current positions
-            user_state = self.info.user_state(self.account_address)
+            user_state = await self._info("user_state", self.account_address)
             positions = user_state.get("assetPositions", [])
 
             # Find the position for this coin
@@ -1094,7 +1313,7 @@ class HyperliquidServices:
                 )
 
                 # Calculate price using HyperLiquid SDK logic
-                limit_px = self._slippage_price(coin, is_buy, slippage)
+                limit_px = await self._slippage_price(coin, is_buy, slippage)
 
                 # Place IOC order with reduce_only=True
                 result = await self.place_order(
@@ -1124,7 +1343,7 @@ class HyperliquidServices:
             )
             return {"success": False, "error": str(e)}
 
-    def _slippage_price(
+    async def _slippage_price(
         self,
         coin: str,
         is_buy: bool,
@@ -1136,22 +1355,12 @@ class HyperliquidServices:
         """
         if not px:
             # Get midprice
-            px = float(self.info.all_mids()[coin])
+            px = float((await self._info("all_mids"))[coin])
 
         # Get asset info for proper rounding
-        meta = self.info.meta()
-        asset_index = None
-        sz_decimals = 0
-
-        # Find asset index and decimals
-        for i, asset_info in enumerate(meta["universe"]):
-            if asset_info["name"] == coin:
-                asset_index = i
-                sz_decimals = asset_info.get("szDecimals", 0)
-                break
-
-        # spot assets start at 10000 (not relevant for our case, but keeping for completeness)
-        is_spot = asset_index is not None and asset_index >= 10_000
+        asset_info = await self._asset_info(coin)
+        sz_decimals = asset_info.sz_decimals if asset_info else 0
+        is_spot = asset_info.is_spot if asset_info else False
 
         # Calculate Slippage
         px *= (1 + slippage) if is_buy else (1 - slippage)
@@ -0,0 +1,164 @@
+import asyncio
+import logging
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import Any
+
+from .constants import DEFAULT_METADATA_REFRESH_INTERVAL, SPOT_ASSET_OFFSET
+
+
+@dataclass(frozen=True)
+class AssetInfo:
+    """Static trading parameters of a single perp or spot asset"""
+
+    name: str
+    coin: str
+    asset: int
+    sz_decimals: int
+    max_leverage: int | None = None
+    only_isolated: bool = False
+    is_spot: bool = False
+
+
+class MetadataCache:
+    """
+    Indexed cache of the perp universe and spot metadata
+
+    Assets are keyed by name for O(1) lookups. The first access loads the
+    metadata; once an entry is older than ``refresh_interval`` the stale copy
+    keeps being served while a refresh runs in the background. Concurrent
+    loads share a single upstream request.
+    """
+
+    def __init__(
+        self,
+        fetch_meta: Callable[[], Awaitable[Any]],
+        fetch_spot_meta: Callable[[], Awaitable[Any]] | None = None,
+        refresh_interval: float | None = DEFAULT_METADATA_REFRESH_INTERVAL,
+        logger: logging.Logger | None = None,
+    ):
+        """
+        Args:
+            fetch_meta: Coroutine function returning the perp ``meta`` response
+            fetch_spot_meta: Coroutine function returning the ``spotMeta`` response
+            refresh_interval: Seconds before cached metadata is refreshed
+                (None disables automatic refresh)
+            logger: Logger used to report failed background refreshes
+        """
+        if refresh_interval is not None and refresh_interval <= 0:
+            raise ValueError("refresh_interval must be positive or None")
+
+        self._fetch_meta = fetch_meta
+        self._fetch_spot_meta = fetch_spot_meta
+        self.refresh_interval = refresh_interval
+        self.logger = logger or logging.getLogger(__name__)
+
+        self._assets: dict[str, AssetInfo] = {}
+        self._loaded_at: float | None = None
+        self._inflight: asyncio.Task | None = None
+
+    @property
+    def is_loaded(self) -> bool:
+        return self._loaded_at is not None
+
+    def is_stale(self) -> bool:
+        if self._loaded_at is None:
+            return True
+        if self.refresh_interval is None:
+            return False
+        return time.monotonic() - self._loaded_at >= self.refresh_interval
+
+    def invalidate(self) -> None:
+        """Drop cached metadata so the next lookup reloads it"""
+        self._assets = {}
+        self._loaded_at = None
+
+    def lookup(self, name: str) -> AssetInfo | None:
+        """Return cached info for ``name`` without touching the network"""
+        return self._assets.get(name)
+
+    async def get(self, name: str) -> AssetInfo | None:
+        """Return info for ``name``, loading or refreshing metadata as needed"""
+        await self.ensure_loaded()
+        return self._assets.get(name)
+
+    async def ensure_loaded(self) -> None:
+        if not self.is_loaded:
+            await self.refresh()
+        elif self.is_stale():
+            self._refresh_in_background()
+
+    async def refresh(self) -> None:
+        """Reload metadata now, joining a load that is already in flight"""
+        await self._start_load()
+
+    def _start_load(self) -> asyncio.Task:
+        task = self._inflight
+        if (
+            task is None
+            or task.done()
+            or task.get_loop() is not asyncio.get_running_loop()
+        ):
+            task = asyncio.ensure_future(self._load())
+            self._inflight = task
+        return task
+
+    def _refresh_in_background(self) -> None:
+        task = self._start_load()
+        task.add_done_callback(self._log_refresh_failure)
+
+    def _log_refresh_failure(self, task: asyncio.Task) -> None:
+        if not task.cancelled() and task.exception() is not None:
+            self.logger.warning(
+                "Background metadata refresh failed: %s", task.exception()
+            )
+
+    async def _load(self) -> None:
+        if self._fetch_spot_meta is None:
+            meta, spot_meta = await self._fetch_meta(), None
+        else:
+            meta, spot_meta = await asyncio.gather(
+                self._fetch_meta(), self._fetch_spot_meta()
+            )
+
+        assets = self._index_perps(meta)
+        if spot_meta:
+            for name, info in self._index_spot(spot_meta).items():
+                assets.setdefault(name, info)
+
+        self._assets = assets
+        self._loaded_at = time.monotonic()
+
+    @staticmethod
+    def _index_perps(meta: dict[str, Any]) -> dict[str, AssetInfo]:
+        assets = {}
+        for index, item in enumerate(meta.get("universe", [])):
+            assets[item["name"]] = AssetInfo(
+                name=item["name"],
+                coin=item["name"],
+                asset=index,
+                sz_decimals=item.get("szDecimals", 0),
+                max_leverage=item.get("maxLeverage"),
+                only_isolated=item.get("onlyIsolated", False),
+            )
+        return assets
+
+    @staticmethod
+    def _index_spot(spot_meta: dict[str, Any]) -> dict[str, AssetInfo]:
+        tokens = spot_meta.get("tokens", [])
+        assets = {}
+        for item in spot_meta.get("universe", []):
+            base, quote = item["tokens"]
+            info = AssetInfo(
+                name=item["name"],
+                coin=item["name"],
+                asset=SPOT_ASSET_OFFSET + item["index"],
+                sz_decimals=tokens[base].get("szDecimals", 0),
+                is_spot=True,
+            )
+            assets[item["name"]] = info
+            # Spot pairs are also addressable as "BASE/QUOTE"
+            pair = f"{tokens[base]['name']}/{tokens[quote]['name']}"
+            assets.setdefault(pair, info)
+        return assets
@@ -0,0 +1,203 @@
+import asyncio
+from collections.abc import Callable
+from typing import Any
+
+import httpx
+
+from .constants import (
+    DEFAULT_CALL_TIMEOUT,
+    DEFAULT_HTTP_KEEPALIVE_EXPIRY,
+    DEFAULT_HTTP_POOL_SIZE,
+)
+
+
+class TransportError(Exception):
+    """Raised when the HyperLiquid API answers with an HTTP error status"""
+
+    def __init__(self, status_code: int, message: str):
+        super().__init__(f"HTTP {status_code}: {message}")
+        self.status_code = status_code
+        self.message = message
+
+
+class AsyncHyperliquidTransport:
+    """
+    Shared asyncio HTTP client for the ``/info`` and ``/exchange`` endpoints
+
+    Requests are issued natively on the event loop over a pooled keep-alive
+    connection set, so no thread hop or TCP/TLS handshake is paid per call.
+    The underlying client is created lazily and re-created if the service is
+    used from a different event loop.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        pool_size: int = DEFAULT_HTTP_POOL_SIZE,
+        http2: bool = False,
+        timeout: float | None = DEFAULT_CALL_TIMEOUT,
+        keepalive_expiry: float = DEFAULT_HTTP_KEEPALIVE_EXPIRY,
+        transport: httpx.AsyncBaseTransport | None = None,
+    ):
+        """
+        Args:
+            base_url: HyperLiquid API base URL
+            pool_size: Maximum number of pooled connections
+            http2: Negotiate HTTP/2 (requires the ``h2`` package)
+            timeout: Request timeout in seconds
+            keepalive_expiry: Seconds an idle pooled connection is kept open
+            transport: Optional custom httpx transport (used by tests)
+        """
+        if pool_size <= 0:
+            raise ValueError("pool_size must be a positive integer")
+        if http2:
+            try:
+                import h2  # noqa: F401
+            except ImportError as e:
+                raise ImportError(
+                    "HTTP/2 support requires the 'h2' package: "
+                    "pip install 'hyperliquid-mcp-python[http2]'"
+                ) from e
+
+        self.base_url = base_url.rstrip("/")
+        self.pool_size = pool_size
+        self.http2 = http2
+        self.timeout = timeout
+        self.limits = httpx.Limits(
+            max_connections=pool_size,
+            max_keepalive_connections=pool_size,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self._transport = transport
+        self._client: httpx.AsyncClient | None = None
+        self._client_loop: asyncio.AbstractEventLoop | None = None
+
+    def _get_client(self) -> httpx.AsyncClient:
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client_loop is not loop:
+            self._client = httpx.AsyncClient(
+                base_url=self.base_url,
+                http2=self.http2,
+                limits=self.limits,
+                timeout=self.timeout,
+                headers={"Content-Type": "application/json"},
+                transport=self._transport,
+            )
+            self._client_loop = loop
+        return self._client
+
+    async def post(self, path: str, payload: dict[str, Any]) -> Any:
+        """POST a JSON payload and return the decoded response"""
+        response = await self._get_client().post(path, json=payload)
+        if response.status_code >= 400:
+            raise TransportError(response.status_code, response.text)
+        try:
+            return response.json()
+        except ValueError:
+            return {"error": f"Could not parse JSON: {response.text}"}
+
+    async def aclose(self) -> None:
+        """Close pooled connections"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+            self._client_loop = None
+
+
+class AsyncInfo:
+    """
+    Async counterparts of the SDK ``Info`` endpoints used by the service
+
+    Method names and arguments mirror ``hyperliquid.info.Info`` so callers can
+    dispatch to either implementation by name.
+    """
+
+    def __init__(
+        self,
+        transport: AsyncHyperliquidTransport,
+        coin_resolver: Callable[[str], str] | None = None,
+    ):
+        """
+        Args:
+            transport: Shared HTTP transport
+            coin_resolver: Maps user-facing names (e.g. "PURR/USDC") to API coins
+        """
+        self.transport = transport
+        self._resolve_coin = coin_resolver or (lambda name: name)
+
+    async def _post(self, payload: dict[str, Any]) -> Any:
+        return await self.transport.post("/info", payload)
+
+    async def user_state(self, address: str, dex: str = "") -> Any:
+        return await self._post(
+            {"type": "clearinghouseState", "user": address, "dex": dex}
+        )
+
+    async def open_orders(self, address: str, dex: str = "") -> Any:
+        return await self._post({"type": "openOrders", "user": address, "dex": dex})
+
+    async def frontend_open_orders(self, address: str, dex: str = "") -> Any:
+        return await self._post(
+            {"type": "frontendOpenOrders", "user": address, "dex": dex}
+        )
+
+    async def all_mids(self, dex: str = "") -> Any:
+        return await self._post({"type": "allMids", "dex": dex})
+
+    async def meta(self, dex: str = "") -> Any:
+        return await self._post({"type": "meta", "dex": dex})
+
+    async def spot_meta(self) -> Any:
+        return await self._post({"type": "spotMeta"})
+
+    async def meta_and_asset_ctxs(self) -> Any:
+        return await self._post({"type": "metaAndAssetCtxs"})
+
+    async def l2_snapshot(self, name: str) -> Any:
+        return await self._post({"type": "l2Book", "coin": self._resolve_coin(name)})
+
+    async def candles_snapshot(
+        self, name: str, interval: str, startTime: int, endTime: int
+    ) -> Any:
+        req = {
+            "coin": self._resolve_coin(name),
+            "interval": interval,
+            "startTime": startTime,
+            "endTime": endTime,
+        }
+        return await self._post({"type": "candleSnapshot", "req": req})
+
+    async def funding_history(
+        self, name: str, startTime: int, endTime: int | None = None
+    ) -> Any:
+        payload = {
+            "type": "fundingHistory",
+            "coin": self._resolve_coin(name),
+            "startTime": startTime,
+        }
+        if endTime is not None:
+            payload["endTime"] = endTime
+        return await self._post(payload)
+
+    async def user_fills(self, address: str) -> Any:
+        return await self._post({"type": "userFills", "user": address})
+
+    async def user_fills_by_time(
+        self,
+        address: str,
+        start_time: int,
+        end_time: int | None = None,
+        aggregate_by_time: bool | None = False,
+    ) -> Any:
+        return await self._post(
+            {
+                "type": "userFillsByTime",
+                "user": address,
+                "startTime": start_time,
+                "endTime": end_time,
+                "aggregateByTime": aggregate_by_time,
+            }
+        )
+
+    async def query_order_by_oid(self, user: str, oid: int) -> Any:
+        return await self._post({"type": "orderStatus", "user": user, "oid": oid})
@@ -0,0 +1,126 @@
+"""账户摘要快照测试"""
+
+import asyncio
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from services.hyperliquid_services import HyperliquidServices
+
+USER_STATE = {
+    "marginSummary": {"accountValue": "1000"},
+    "assetPositions": [
+        {
+            "position": {
+                "coin": "BTC",
+                "szi": "0.5",
+                "entryPx": "50000",
+                "unrealizedPnl": "10",
+                "returnOnEquity": "0.01",
+                "marginUsed": "100",
+            }
+        },
+        {
+            "position": {
+                "coin": "ETH",
+                "szi": "0",
+                "entryPx": "3000",
+                "unrealizedPnl": "0",
+                "returnOnEquity": "0",
+                "marginUsed": "0",
+            }
+        },
+    ],
+}
+
+OPEN_ORDERS = [
+    {
+        "oid": 7,
+        "coin": "BTC",
+        "side": "B",
+        "sz": "0.1",
+        "limitPx": "49000",
+        "timestamp": 1,
+    }
+]
+
+
+@pytest.fixture
+def service_with_mocks():
+    """创建带有 Info/Exchange mock 的服务实例"""
+    with (
+        patch("services.hyperliquid_services.Info") as mock_info_class,
+        patch("services.hyperliquid_services.Exchange"),
+        patch("eth_account.Account") as mock_account_class,
+    ):
+        mock_account_class.from_key.return_value = MagicMock(address="0xFAKE")
+        info_instance = MagicMock()
+        mock_info_class.return_value = info_instance
+
+        service = HyperliquidServices(
+            private_key="0x" + "1" * 64,
+            testnet=True,
+            account_address="0xACCOUNT",
+        )
+
+    return service, info_instance
+
+
+def test_summary_uses_single_snapshot(service_with_mocks):
+    """余额与持仓来自同一次 clearinghouseState 请求"""
+    service, info_instance = service_with_mocks
+    info_instance.user_state.return_value = USER_STATE
+    info_instance.open_orders.return_value = OPEN_ORDERS
+
+    result = asyncio.run(service.get_account_summary())
+
+    assert result["success"] is True
+    summary = result["summary"]
+    assert summary["balance"] is USER_STATE
+    assert [p["coin"] for p in summary["positions"]] == ["BTC"]
+    assert summary["total_positions"] == 1
+    assert summary["orders"][0]["order_id"] == 7
+    assert summary["total_orders"] == 1
+    assert "errors" not in result
+    info_instance.user_state.assert_called_once_with("0xACCOUNT")
+    info_instance.open_orders.assert_called_once_with("0xACCOUNT")
+
+
+def test_summary_requests_run_concurrently(service_with_mocks):
+    """两个上游请求并发发出"""
+    service, info_instance = service_with_mocks
+    barrier = threading.Barrier(2, timeout=1.0)
+
+    def user_state(address):
+        barrier.wait()
+        return USER_STATE
+
+    def open_orders(address):
+        barrier.wait()
+        return OPEN_ORDERS
+
+    info_instance.user_state.side_effect = user_state
+    info_instance.open_orders.side_effect = open_orders
+
+    started = time.perf_counter()
+    result = asyncio.run(service.get_account_summary())
+
+    assert result["success"] is True
+    assert time.perf_counter() - started < 1.0
+
+
+def test_summary_degrades_per_section(service_with_mocks):
+    """单个请求失败时其余部分仍然返回"""
+    service, info_instance = service_with_mocks
+    info_instance.user_state.side_effect = RuntimeError("boom")
+    info_instance.open_orders.return_value = OPEN_ORDERS
+
+    result = asyncio.run(service.get_account_summary())
+
+    assert result["success"] is True
+    assert result["summary"]["balance"] is None
+    assert result["summary"]["positions"] == []
+    assert result["summary"]["total_orders"] == 1
+    assert result["errors"] == {"balance": "boom"}
@@ -1,6 +1,8 @@
 """批量 K 线快照服务测试"""
 
 import asyncio
+import threading
+import time
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -121,3 +123,78 @@ def test_get_candles_snapshot_bulk_invalid_params(service_with_mocks):
 
     assert result["success"] is False
     assert "days cannot be used" in result["error"]
+
+
+def test_get_candles_snapshot_bulk_fans_out_concurrently(service_with_mocks):
+    """多币种请求并发执行，耗时接近最慢的单个币种"""
+    service, info_instance = service_with_mocks
+
+    def slow_snapshot(coin, interval, start, end):
+        time.sleep(0.1)
+        return [{"t": 1, "o": "1", "h": "2", "l": "0.5", "c": "1.5", "v": "10"}]
+
+    info_instance.candles_snapshot.side_effect = slow_snapshot
+    coins = ["BTC", "ETH", "SOL", "ARB"]
+
+    started = time.perf_counter()
+    result = asyncio.run(
+        service.get_candles_snapshot_bulk(coins, "1h", start_time=1, end_time=2)
+    )
+    elapsed = time.perf_counter() - started
+
+    assert result["success"] is True
+    assert list(result["data"].keys()) == coins
+    assert elapsed < 0.3
+
+
+def test_get_candles_snapshot_bulk_respects_max_in_flight(service_with_mocks):
+    """同时在途的请求数不超过 candle_concurrency，且保持请求顺序"""
+    service, info_instance = service_with_mocks
+    service.candle_concurrency = 2
+    lock = threading.Lock()
+    in_flight = 0
+    peak = 0
+
+    def tracked_snapshot(coin, interval, start, end):
+        nonlocal in_flight, peak
+        with lock:
+            in_flight += 1
+            peak = max(peak, in_flight)
+        # 让靠前的币种更慢完成，验证结果顺序不依赖完成顺序
+        time.sleep(0.05 if coin in ("C0", "C1") else 0.01)
+        with lock:
+            in_flight -= 1
+        return [{"t": 1, "o": "1", "h": "1", "l": "1", "c": "1", "v": "1"}]
+
+    info_instance.candles_snapshot.side_effect = tracked_snapshot
+    coins = [f"C{i}" for i in range(6)]
+
+    result = asyncio.run(
+        service.get_candles_snapshot_bulk(coins, "1m", start_time=1, end_time=2)
+    )
+
+    assert peak == 2
+    assert list(result["data"].keys()) == coins
+
+
+def test_get_candles_snapshot_bulk_per_coin_timeout(service_with_mocks):
+    """单个币种超时只记录到 coin_errors"""
+    service, info_instance = service_with_mocks
+    service.candle_timeout = 0.05
+
+    def candles_snapshot(coin, interval, start, end):
+        if coin == "ETH":
+            time.sleep(0.2)
+        return [{"t": 1, "o": "1", "h": "2", "l": "0.5", "c": "1.5", "v": "10"}]
+
+    info_instance.candles_snapshot = candles_snapshot
+
+    result = asyncio.run(
+        service.get_candles_snapshot_bulk(
+            ["BTC", "ETH"], "1h", start_time=1, end_time=2
+        )
+    )
+
+    assert result["success"] is True
+    assert list(result["data"].keys()) == ["BTC"]
+    assert "timed out" in result["coin_errors"]["ETH"]
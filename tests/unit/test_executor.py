@@ -0,0 +1,121 @@
+"""SDK 调用调度层测试"""
+
+import asyncio
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from services.executor import SDKCallTimeoutError, SDKExecutor
+from services.hyperliquid_services import HyperliquidServices
+
+
+@pytest.fixture
+def executor():
+    pool = SDKExecutor(max_workers=4, call_timeout=1.0)
+    yield pool
+    pool.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_blocking_calls_overlap(executor):
+    """阻塞调用在线程池中并发执行，不阻塞事件循环"""
+    started = time.perf_counter()
+    results = await asyncio.gather(
+        *(executor.run(time.sleep, 0.1) for _ in range(4)),
+        asyncio.sleep(0.01),
+    )
+    elapsed = time.perf_counter() - started
+
+    assert results == [None] * 5
+    assert elapsed < 0.3
+
+
+@pytest.mark.asyncio
+async def test_pool_bounds_concurrency():
+    """线程池大小限制同时在途的调用数"""
+    pool = SDKExecutor(max_workers=2, call_timeout=1.0)
+    lock = threading.Lock()
+    in_flight = 0
+    peak = 0
+
+    def slow_call():
+        nonlocal in_flight, peak
+        with lock:
+            in_flight += 1
+            peak = max(peak, in_flight)
+        time.sleep(0.02)
+        with lock:
+            in_flight -= 1
+
+    try:
+        await asyncio.gather(*(pool.run(slow_call) for _ in range(6)))
+    finally:
+        pool.shutdown()
+
+    assert peak == 2
+
+
+@pytest.mark.asyncio
+async def test_timeout_cancels_queued_call():
+    """超时的排队调用不会再被执行"""
+    pool = SDKExecutor(max_workers=1, call_timeout=1.0)
+    queued = MagicMock()
+
+    try:
+        blocker = asyncio.ensure_future(pool.run(time.sleep, 0.2))
+        await asyncio.sleep(0.01)
+        with pytest.raises(SDKCallTimeoutError, match="timed out after 0.05s"):
+            await pool.run(queued, timeout=0.05)
+        await blocker
+    finally:
+        pool.shutdown(wait=True)
+
+    queued.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_coroutine_functions_are_awaited(executor):
+    """协程函数直接在事件循环上等待"""
+
+    async def fetch(value):
+        return value * 2
+
+    assert await executor.run(fetch, 21) == 42
+
+
+def test_invalid_settings_rejected():
+    with pytest.raises(ValueError):
+        SDKExecutor(max_workers=0)
+    with pytest.raises(ValueError):
+        SDKExecutor(call_timeout=0)
+
+
+def test_service_reports_upstream_timeout():
+    """服务层将超时转换为标准错误响应"""
+    with (
+        patch("services.hyperliquid_services.Info") as mock_info_class,
+        patch("services.hyperliquid_services.Exchange"),
+        patch("eth_account.Account") as mock_account_class,
+    ):
+        mock_account_class.from_key.return_value = MagicMock(address="0xFAKE")
+
+        def l2_snapshot(coin):
+            time.sleep(0.2)
+
+        info_instance = MagicMock()
+        info_instance.l2_snapshot = l2_snapshot
+        mock_info_class.return_value = info_instance
+
+        service = HyperliquidServices(
+            private_key="0x" + "1" * 64,
+            testnet=True,
+            account_address="0xACCOUNT",
+            call_timeout=0.05,
+        )
+
+    result = asyncio.run(service.get_orderbook("BTC"))
+
+    assert result["success"] is False
+    assert "l2_snapshot timed out" in result["error"]
@@ -0,0 +1,157 @@
+"""资产元数据缓存测试"""
+
+import asyncio
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from services.hyperliquid_services import HyperliquidServices
+from services.metadata import MetadataCache
+
+META = {
+    "universe": [
+        {"name": "BTC", "szDecimals": 5, "maxLeverage": 50},
+        {"name": "ETH", "szDecimals": 4, "maxLeverage": 25, "onlyIsolated": True},
+    ]
+}
+
+SPOT_META = {
+    "tokens": [
+        {"name": "USDC", "szDecimals": 8},
+        {"name": "PURR", "szDecimals": 0},
+    ],
+    "universe": [{"name": "PURR/USDC", "tokens": [1, 0], "index": 0}],
+}
+
+
+class CountingFetcher:
+    """记录调用次数的元数据获取函数"""
+
+    def __init__(self, response):
+        self.response = response
+        self.calls = 0
+
+    async def __call__(self):
+        self.calls += 1
+        await asyncio.sleep(0)
+        return self.response
+
+
+@pytest.mark.asyncio
+async def test_assets_are_indexed_by_name():
+    cache = MetadataCache(CountingFetcher(META), CountingFetcher(SPOT_META))
+
+    btc = await cache.get("BTC")
+    eth = await cache.get("ETH")
+    purr = await cache.get("PURR/USDC")
+
+    assert (btc.asset, btc.sz_decimals, btc.max_leverage) == (0, 5, 50)
+    assert (eth.asset, eth.only_isolated) == (1, True)
+    assert (purr.asset, purr.is_spot, purr.sz_decimals) == (10_000, True, 0)
+    assert await cache.get("DOGE") is None
+
+
+@pytest.mark.asyncio
+async def test_concurrent_lookups_share_one_load():
+    """并发首次访问只触发一次上游请求"""
+    fetch_meta = CountingFetcher(META)
+    cache = MetadataCache(fetch_meta)
+
+    await asyncio.gather(*(cache.get("BTC") for _ in range(10)))
+    await cache.get("ETH")
+
+    assert fetch_meta.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_stale_metadata_refreshes_in_background(monkeypatch):
+    """过期后先返回旧数据，并在后台刷新"""
+    now = [0.0]
+    monkeypatch.setattr("services.metadata.time.monotonic", lambda: now[0])
+    fetch_meta = CountingFetcher(META)
+    cache = MetadataCache(fetch_meta, refresh_interval=60)
+    await cache.get("BTC")
+
+    fetch_meta.response = {"universe": [{"name": "SOL", "szDecimals": 2}]}
+    now[0] = 61.0
+
+    assert (await cache.get("BTC")).asset == 0
+    await asyncio.sleep(0.01)
+    assert fetch_meta.calls == 2
+    assert await cache.get("BTC") is None
+    assert (await cache.get("SOL")).asset == 0
+
+
+@pytest.mark.asyncio
+async def test_invalidate_forces_reload():
+    fetch_meta = CountingFetcher(META)
+    cache = MetadataCache(fetch_meta, refresh_interval=None)
+    await cache.get("BTC")
+
+    cache.invalidate()
+    assert cache.lookup("BTC") is None
+    await cache.get("BTC")
+
+    assert fetch_meta.calls == 2
+
+
+@pytest.fixture
+def service_with_mocks():
+    """创建带有 Info/Exchange mock 的服务实例"""
+    with (
+        patch("services.hyperliquid_services.Info") as mock_info_class,
+        patch("services.hyperliquid_services.Exchange"),
+        patch("eth_account.Account") as mock_account_class,
+    ):
+        mock_account_class.from_key.return_value = MagicMock(address="0xFAKE")
+        info_instance = MagicMock()
+        info_instance.meta.return_value = META
+        info_instance.spot_meta.return_value = SPOT_META
+        info_instance.all_mids.return_value = {"ETH": "3000"}
+        info_instance.l2_snapshot.return_value = {"levels": [[], []]}
+        mock_info_class.return_value = info_instance
+
+        service = HyperliquidServices(
+            private_key="0x" + "1" * 64,
+            testnet=True,
+            account_address="0xACCOUNT",
+        )
+
+    return service, info_instance
+
+
+def test_service_reuses_cached_metadata(service_with_mocks):
+    """多次行情与滑点计算只请求一次 meta"""
+    service, info_instance = service_with_mocks
+
+    async def run():
+        first = await service.get_market_data("ETH")
+        second = await service.get_market_data("ETH")
+        price = await service._slippage_price("ETH", True, 0.01)
+        return first, second, price
+
+    first, second, price = asyncio.run(run())
+
+    assert first["market_data"]["max_leverage"] == 25
+    assert second["market_data"]["only_isolated"] is True
+    assert price == 3030.0
+    info_instance.meta.assert_called_once()
+    info_instance.spot_meta.assert_called_once()
+
+
+def test_actions_use_cached_asset_index(service_with_mocks):
+    """撤单使用缓存中的资产编号，包括现货"""
+    service, info_instance = service_with_mocks
+    actions = []
+
+    async def capture(action):
+        actions.append(action)
+        return {"status": "ok"}
+
+    service._sign_and_post = capture
+
+    result = asyncio.run(service.cancel_order("PURR/USDC", 9))
+
+    assert result["success"] is True
+    assert actions[0]["cancels"] == [{"a": 10_000, "o": 9}]
+    info_instance.name_to_asset.assert_not_called()
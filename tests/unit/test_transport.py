@@ -0,0 +1,169 @@
+"""异步 HTTP 传输层测试"""
+
+import asyncio
+import json
+from unittest.mock import MagicMock, patch
+
+import httpx
+import pytest
+
+from services.hyperliquid_services import HyperliquidServices
+from services.transport import AsyncHyperliquidTransport, AsyncInfo, TransportError
+
+
+class RecordingHandler:
+    """记录请求并按路径返回预设响应的 MockTransport 处理器"""
+
+    def __init__(self, responses: dict[str, object], status_code: int = 200):
+        self.responses = responses
+        self.status_code = status_code
+        self.requests: list[tuple[str, dict]] = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        payload = json.loads(request.content)
+        self.requests.append((request.url.path, payload))
+        return httpx.Response(
+            self.status_code, json=self.responses.get(request.url.path)
+        )
+
+
+@pytest.mark.asyncio
+async def test_info_requests_use_sdk_payloads():
+    """AsyncInfo 发送与 SDK 相同的请求体"""
+    handler = RecordingHandler({"/info": {"BTC": "50000"}})
+    transport = AsyncHyperliquidTransport(
+        "https://api.mock", transport=httpx.MockTransport(handler)
+    )
+    info = AsyncInfo(transport)
+
+    assert await info.all_mids() == {"BTC": "50000"}
+    await info.candles_snapshot("ETH", "1h", 1, 2)
+    await transport.aclose()
+
+    assert handler.requests == [
+        ("/info", {"type": "allMids", "dex": ""}),
+        (
+            "/info",
+            {
+                "type": "candleSnapshot",
+                "req": {"coin": "ETH", "interval": "1h", "startTime": 1, "endTime": 2},
+            },
+        ),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_http_error_raises_transport_error():
+    handler = RecordingHandler({}, status_code=429)
+    transport = AsyncHyperliquidTransport(
+        "https://api.mock", transport=httpx.MockTransport(handler)
+    )
+
+    with pytest.raises(TransportError) as exc_info:
+        await transport.post("/info", {"type": "meta"})
+    await transport.aclose()
+
+    assert exc_info.value.status_code == 429
+
+
+def test_pool_limits_follow_configuration():
+    transport = AsyncHyperliquidTransport("https://api.mock/", pool_size=7)
+
+    assert transport.base_url == "https://api.mock"
+    assert transport.limits.max_connections == 7
+    assert transport.limits.max_keepalive_connections == 7
+    with pytest.raises(ValueError):
+        AsyncHyperliquidTransport("https://api.mock", pool_size=0)
+
+
+def test_client_is_recreated_for_new_event_loop():
+    """跨事件循环使用时重新创建连接池"""
+    handler = RecordingHandler({"/info": {}})
+    transport = AsyncHyperliquidTransport(
+        "https://api.mock", transport=httpx.MockTransport(handler)
+    )
+
+    async def fetch():
+        await transport.post("/info", {"type": "meta"})
+        return transport._client
+
+    first = asyncio.run(fetch())
+    second = asyncio.run(fetch())
+
+    assert first is not second
+    assert len(handler.requests) == 2
+
+
+@pytest.fixture
+def async_service():
+    """启用异步传输并接入 MockTransport 的服务实例"""
+    with (
+        patch("services.hyperliquid_services.Info") as mock_info_class,
+        patch("services.hyperliquid_services.Exchange") as mock_exchange_class,
+        patch("eth_account.Account") as mock_account_class,
+    ):
+        mock_account_class.from_key.return_value = MagicMock(address="0xFAKE")
+        info_instance = MagicMock()
+        info_instance.name_to_asset.return_value = 3
+        mock_info_class.return_value = info_instance
+        exchange_instance = MagicMock(vault_address=None, expires_after=None)
+        mock_exchange_class.return_value = exchange_instance
+
+        service = HyperliquidServices(
+            private_key="0x" + "1" * 64,
+            testnet=True,
+            account_address="0xACCOUNT",
+            async_transport=True,
+        )
+
+    handler = RecordingHandler(
+        {
+            "/info": [],
+            "/exchange": {"status": "ok", "response": {"type": "cancel"}},
+        }
+    )
+    service.transport._transport = httpx.MockTransport(handler)
+    return service, info_instance, exchange_instance, handler
+
+
+@pytest.mark.asyncio
+async def test_service_reads_go_through_transport(async_service):
+    """启用后读取请求不再调用阻塞 SDK"""
+    service, info_instance, _, handler = async_service
+
+    result = await service.get_open_orders()
+    await service.transport.aclose()
+
+    assert result["success"] is True
+    assert handler.requests == [
+        ("/info", {"type": "openOrders", "user": "0xACCOUNT", "dex": ""})
+    ]
+    info_instance.open_orders.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_service_actions_post_natively(async_service, monkeypatch):
+    """签名后的操作直接 POST 到 /exchange"""
+    service, _, exchange_instance, handler = async_service
+    monkeypatch.setattr(
+        "services.hyperliquid_services.sign_l1_action", lambda *args: "sig"
+    )
+
+    result = await service.cancel_order("BTC", 42)
+    await service.transport.aclose()
+
+    assert result["success"] is True
+    path, payload = handler.requests[-1]
+    assert path == "/exchange"
+    assert payload["action"] == {"type": "cancel", "cancels": [{"a": 3, "o": 42}]}
+    assert payload["signature"] == "sig"
+    exchange_instance._post_action.assert_not_called()
+
+
+def test_nonces_are_strictly_increasing(async_service, monkeypatch):
+    service = async_service[0]
+    monkeypatch.setattr("services.hyperliquid_services.time.time", lambda: 1.0)
+
+    nonces = [service._next_nonce() for _ in range(3)]
+
+    assert nonces == [1000, 1001, 1002]